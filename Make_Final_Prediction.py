@@ -1,12 +1,20 @@
 import pandas as pd
 
-# Load your best model's predictions (here, Exponential Smoothing)
-df = pd.read_csv("predictionsExpSmooth.csv")
+SUBMISSION_COLS = ["dt", "atm_id", "predicted_withdrawn_kwd", "predicted_withdraw_count"]
 
-# Keep only the required columns and order
-df = df[["dt", "atm_id", "predicted_withdrawn_kwd", "predicted_withdraw_count"]]
+def main(df=None):
+    # Load your best model's predictions (here, Exponential Smoothing)
+    if df is None:
+        df = pd.read_csv("predictionsExpSmooth.csv")
 
-# Save as final submission file
-df.to_csv("predictions.csv", index=False)
+    # Keep only the required columns and order
+    df = df[SUBMISSION_COLS]
 
-print("✅ Created predictions.csv successfully:", df.shape)
+    # Save as final submission file
+    df.to_csv("predictions.csv", index=False)
+
+    print("✅ Created predictions.csv successfully:", df.shape)
+    return df
+
+if __name__ == "__main__":
+    main()
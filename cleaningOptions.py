@@ -0,0 +1,15 @@
+# cleaningOptions.py  —  command-line options for dataCleaning.py
+# Kept free of pandas/numpy so `python -m pipeline clean --help` (and bad
+# arguments) are answered without importing the cleaner itself.
+
+DEFAULT_INPUT = "atm_transactions_train.csv"
+DEFAULT_OUT_CLEAN = "cleaned.csv"
+DEFAULT_OUT_FEATURES = "features.csv"
+
+def add_clean_arguments(p):
+    p.add_argument("--input", default=DEFAULT_INPUT, help=f"Path to ATM CSV. Default: {DEFAULT_INPUT}")
+    p.add_argument("--out-clean", default=DEFAULT_OUT_CLEAN, help=f"Output CSV for cleaned base. Default: {DEFAULT_OUT_CLEAN}")
+    p.add_argument("--out-features", default=DEFAULT_OUT_FEATURES, help=f"Output CSV for features. Default: {DEFAULT_OUT_FEATURES}")
+    p.add_argument("--weekend", default=None, help="Comma-separated weekend DOWs (0=Mon..6=Sun). Default: '4,5'")
+    p.add_argument("--no-impute", action="store_true", help="Do NOT impute NaNs in engineered features.")
+    return p
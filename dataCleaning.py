@@ -3,6 +3,8 @@
 #   python clean_atm_data.py
 # or:
 #   python clean_atm_data.py --input "atm_transactions_train.csv" --out-clean "cleaned.csv" --out-features "features.csv" --weekend "4,5"
+# or, through the pipeline CLI (same options):
+#   python -m pipeline clean --input "atm_transactions_train.csv"
 
 import argparse
 import sys
@@ -10,9 +12,8 @@ import os
 import pandas as pd
 import numpy as np
 
-DEFAULT_INPUT = "atm_transactions_train.csv"
-DEFAULT_OUT_CLEAN = "cleaned.csv"
-DEFAULT_OUT_FEATURES = "features.csv"
+from cleaningOptions import DEFAULT_INPUT, DEFAULT_OUT_CLEAN, DEFAULT_OUT_FEATURES, add_clean_arguments
+
 DEFAULT_WEEKEND = {4, 5}  # Fri(4), Sat(5) for Kuwait; Monday=0
 
 RENAME_MAP = {
@@ -206,17 +207,12 @@ def build_outputs(input_csv, out_clean, out_features, weekend_arg, fill_feature_
     except Exception:
         pass
 
-def main():
-    p = argparse.ArgumentParser()
-    p.add_argument("--input", default=DEFAULT_INPUT, help=f"Path to ATM CSV. Default: {DEFAULT_INPUT}")
-    p.add_argument("--out-clean", default=DEFAULT_OUT_CLEAN, help=f"Output CSV for cleaned base. Default: {DEFAULT_OUT_CLEAN}")
-    p.add_argument("--out-features", default=DEFAULT_OUT_FEATURES, help=f"Output CSV for features. Default: {DEFAULT_OUT_FEATURES}")
-    p.add_argument("--weekend", default=None, help="Comma-separated weekend DOWs (0=Mon..6=Sun). Default: '4,5'")
-    p.add_argument("--no-impute", action="store_true", help="Do NOT impute NaNs in engineered features.")
-    args = p.parse_args()
+    return clean_base, feat
 
+def run(args):
+    # `args` comes from a parser set up with cleaningOptions.add_clean_arguments
     try:
-        build_outputs(
+        return build_outputs(
             input_csv=args.input,
             out_clean=args.out_clean,
             out_features=args.out_features,
@@ -232,5 +228,10 @@ def main():
         eprint("  • If you passed --weekend, use digits 0..6 like --weekend \"4,5\".")
         sys.exit(1)
 
+def main(argv=None):
+    p = add_clean_arguments(argparse.ArgumentParser())
+    args = p.parse_args(argv)
+    run(args)
+
 if __name__ == "__main__":
     main()
@@ -1,77 +1,71 @@
 import pandas as pd
 import numpy as np
 
+NEED_ACTUALS = ["dt", "atm_id", "withdrawn_kwd", "withdraw_count"]
+NEED_PRED = ["dt", "atm_id", "predicted_withdrawn_kwd", "predicted_withdraw_count"]
+
 # -----------------------------
-# 1) Load data
+# 1) Validate columns
 # -----------------------------
-df = pd.read_csv("cleaned.csv", parse_dates=["dt"])
-pred = pd.read_csv("predictions.csv", parse_dates=["dt"])
-print(f"Loaded actuals: {df.shape}, predictions: {pred.shape}")
-
-# Required columns
-need_actuals = ["dt", "atm_id", "withdrawn_kwd", "withdraw_count"]
-need_pred = ["dt", "atm_id", "predicted_withdrawn_kwd", "predicted_withdraw_count"]
-
-miss_a = [c for c in need_actuals if c not in df.columns]
-miss_p = [c for c in need_pred if c not in pred.columns]
-if miss_a:
-    raise ValueError(f"cleaned.csv missing columns: {miss_a}")
-if miss_p:
-    raise ValueError(f"predictions.csv missing columns: {miss_p}")
-
-df = df[need_actuals].copy()
-pred = pred[need_pred].copy()
+def check_columns(df, pred, actuals_label="actuals", pred_label="predictions"):
+    miss_a = [c for c in NEED_ACTUALS if c not in df.columns]
+    miss_p = [c for c in NEED_PRED if c not in pred.columns]
+    if miss_a:
+        raise ValueError(f"{actuals_label} missing columns: {miss_a}")
+    if miss_p:
+        raise ValueError(f"{pred_label} missing columns: {miss_p}")
 
 # -----------------------------
 # 2) Clean actuals
 # -----------------------------
-df = df.dropna(subset=["atm_id", "dt"])
-df["withdrawn_kwd"] = pd.to_numeric(df["withdrawn_kwd"], errors="coerce")
-df["withdraw_count"] = pd.to_numeric(df["withdraw_count"], errors="coerce")
-
-df = df.sort_values(["atm_id", "dt"]).drop_duplicates(["atm_id", "dt"], keep="last")
-
-df[["withdrawn_kwd", "withdraw_count"]] = (
-    df.groupby("atm_id", group_keys=False)[["withdrawn_kwd", "withdraw_count"]]
-      .apply(lambda g: g.ffill().bfill())
-      .fillna(0)
-)
-df["withdrawn_kwd"] = df["withdrawn_kwd"].clip(lower=0)
-df["withdraw_count"] = df["withdraw_count"].clip(lower=0)
+def clean_actuals(df):
+    df = df[NEED_ACTUALS].copy()
+    df["dt"] = pd.to_datetime(df["dt"], errors="coerce")
+    df = df.dropna(subset=["atm_id", "dt"])
+    df["withdrawn_kwd"] = pd.to_numeric(df["withdrawn_kwd"], errors="coerce")
+    df["withdraw_count"] = pd.to_numeric(df["withdraw_count"], errors="coerce")
+
+    df = df.sort_values(["atm_id", "dt"]).drop_duplicates(["atm_id", "dt"], keep="last")
+
+    df[["withdrawn_kwd", "withdraw_count"]] = (
+        df.groupby("atm_id", group_keys=False)[["withdrawn_kwd", "withdraw_count"]]
+          .apply(lambda g: g.ffill().bfill())
+          .fillna(0)
+    )
+    df["withdrawn_kwd"] = df["withdrawn_kwd"].clip(lower=0)
+    df["withdraw_count"] = df["withdraw_count"].clip(lower=0)
+    return df
 
 # -----------------------------
 # 3) Clean predictions
 # -----------------------------
-pred = pred.dropna(subset=["atm_id", "dt"])
-pred["predicted_withdrawn_kwd"] = pd.to_numeric(pred["predicted_withdrawn_kwd"], errors="coerce")
-pred["predicted_withdraw_count"] = pd.to_numeric(pred["predicted_withdraw_count"], errors="coerce")
-
-pred = pred.sort_values(["atm_id", "dt"]).drop_duplicates(["atm_id", "dt"], keep="last")
+def clean_predictions(pred, atm_ids):
+    pred = pred[NEED_PRED].copy()
+    pred["dt"] = pd.to_datetime(pred["dt"], errors="coerce")
+    pred = pred.dropna(subset=["atm_id", "dt"])
+    pred["predicted_withdrawn_kwd"] = pd.to_numeric(pred["predicted_withdrawn_kwd"], errors="coerce")
+    pred["predicted_withdraw_count"] = pd.to_numeric(pred["predicted_withdraw_count"], errors="coerce")
 
-# Ensure complete ATM × date grid
-atm_ids = np.sort(df["atm_id"].unique())
-forecast_dates = np.sort(pred["dt"].unique())
+    pred = pred.sort_values(["atm_id", "dt"]).drop_duplicates(["atm_id", "dt"], keep="last")
 
-expected = len(atm_ids) * len(forecast_dates)
-missing_rows = expected - len(pred)
+    # Ensure complete ATM × date grid
+    forecast_dates = np.sort(pred["dt"].unique())
 
-if missing_rows > 0:
-    print(f"[Predictions] filling {missing_rows} missing (atm_id, dt) pairs with 0s")
-    full_index = pd.MultiIndex.from_product([atm_ids, forecast_dates], names=["atm_id", "dt"])
-    pred = pred.set_index(["atm_id", "dt"]).reindex(full_index).reset_index()
+    expected = len(atm_ids) * len(forecast_dates)
+    missing_rows = expected - len(pred)
 
-pred["predicted_withdrawn_kwd"] = pred["predicted_withdrawn_kwd"].fillna(0).clip(lower=0)
-pred["predicted_withdraw_count"] = pred["predicted_withdraw_count"].fillna(0).clip(lower=0).round().astype(int)
+    if missing_rows > 0:
+        print(f"[Predictions] filling {missing_rows} missing (atm_id, dt) pairs with 0s")
+        full_index = pd.MultiIndex.from_product([atm_ids, forecast_dates], names=["atm_id", "dt"])
+        pred = pred.set_index(["atm_id", "dt"]).reindex(full_index).reset_index()
 
-pred = pred.sort_values(["atm_id", "dt"]).reset_index(drop=True)
+    pred["predicted_withdrawn_kwd"] = pred["predicted_withdrawn_kwd"].fillna(0).clip(lower=0)
+    pred["predicted_withdraw_count"] = pred["predicted_withdraw_count"].fillna(0).clip(lower=0).round().astype(int)
 
-# -----------------------------
-# 4) Align actuals & predictions
-# -----------------------------
-merged = pd.merge(df, pred, on=["atm_id", "dt"], how="inner", validate="1:1").sort_values(["atm_id", "dt"])
+    return pred.sort_values(["atm_id", "dt"]).reset_index(drop=True)
 
 # -----------------------------
-# 5) RMSE (NumPy)
+# 4) RMSE (NumPy)
 # -----------------------------
 def rmse_np(actual: pd.Series, pred: pd.Series) -> float:
     a = actual.to_numpy(dtype=float)
@@ -81,19 +75,46 @@ def rmse_np(actual: pd.Series, pred: pd.Series) -> float:
         return np.nan
     return float(np.sqrt(np.mean((a[mask] - p[mask]) ** 2)))
 
-rmse_kwd = rmse_np(merged["withdrawn_kwd"], merged["predicted_withdrawn_kwd"])
-rmse_cnt = rmse_np(merged["withdraw_count"], merged["predicted_withdraw_count"])
-
-print("\n📊 RMSE RESULTS")
-print(f" - Withdrawn KWD:  {rmse_kwd:.6f}")
-print(f" - Withdraw Count: {rmse_cnt:.6f}")
-
-# -----------------------------
-# 6) Sanity checks
-# -----------------------------
-print("\n🔍 Final Checks")
-print(f"Duplicates in merged: {merged.duplicated(subset=['atm_id','dt']).sum()}")
-print("Missing values:")
-print(merged[["withdrawn_kwd","withdraw_count","predicted_withdrawn_kwd","predicted_withdraw_count"]].isna().sum())
-
-print("\n✅ Evaluation complete (no CSVs written).")
+def main(df=None, pred=None, actuals_csv="cleaned.csv", predictions_csv="predictions.csv"):
+    # -----------------------------
+    # 5) Load data
+    # -----------------------------
+    # Frames passed in from another stage skip the CSV round-trip
+    actuals_label, pred_label = "actuals frame", "predictions frame"
+    if df is None:
+        df = pd.read_csv(actuals_csv, parse_dates=["dt"])
+        actuals_label = actuals_csv
+    if pred is None:
+        pred = pd.read_csv(predictions_csv, parse_dates=["dt"])
+        pred_label = predictions_csv
+    print(f"Loaded actuals: {df.shape}, predictions: {pred.shape}")
+
+    check_columns(df, pred, actuals_label, pred_label)
+    df = clean_actuals(df)
+    pred = clean_predictions(pred, np.sort(df["atm_id"].unique()))
+
+    # -----------------------------
+    # 6) Align actuals & predictions
+    # -----------------------------
+    merged = pd.merge(df, pred, on=["atm_id", "dt"], how="inner", validate="1:1").sort_values(["atm_id", "dt"])
+
+    rmse_kwd = rmse_np(merged["withdrawn_kwd"], merged["predicted_withdrawn_kwd"])
+    rmse_cnt = rmse_np(merged["withdraw_count"], merged["predicted_withdraw_count"])
+
+    print("\n📊 RMSE RESULTS")
+    print(f" - Withdrawn KWD:  {rmse_kwd:.6f}")
+    print(f" - Withdraw Count: {rmse_cnt:.6f}")
+
+    # -----------------------------
+    # 7) Sanity checks
+    # -----------------------------
+    print("\n🔍 Final Checks")
+    print(f"Duplicates in merged: {merged.duplicated(subset=['atm_id','dt']).sum()}")
+    print("Missing values:")
+    print(merged[["withdrawn_kwd","withdraw_count","predicted_withdrawn_kwd","predicted_withdraw_count"]].isna().sum())
+
+    print("\n✅ Evaluation complete (no CSVs written).")
+    return {"rmse_kwd": rmse_kwd, "rmse_cnt": rmse_cnt}
+
+if __name__ == "__main__":
+    main()
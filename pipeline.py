@@ -0,0 +1,78 @@
+# pipeline.py  —  single entry point for every stage
+# Run:
+#   python -m pipeline clean [--input ... --out-clean ... --weekend "4,5"]
+#   python -m pipeline train [--skip-clean]
+#   python -m pipeline predict
+#   python -m pipeline eval [--actuals cleaned.csv --predictions predictions.csv]
+#   python -m pipeline finalize
+#
+# Stage modules (and pandas with them) are only imported inside the command
+# that needs them, so `--help` and argument errors return immediately.
+
+import argparse
+import sys
+
+from cleaningOptions import add_clean_arguments
+
+
+def cmd_clean(args):
+    import dataCleaning
+    dataCleaning.run(args)
+
+
+def cmd_train(args):
+    import train
+    train.main(clean=not args.skip_clean)
+
+
+def cmd_predict(args):
+    import predict
+    predict.main()
+
+
+def cmd_eval(args):
+    import evalPredictionsMean
+    evalPredictionsMean.main(actuals_csv=args.actuals, predictions_csv=args.predictions)
+
+
+def cmd_finalize(args):
+    import Make_Final_Prediction
+    Make_Final_Prediction.main()
+
+
+def build_parser():
+    p = argparse.ArgumentParser(prog="pipeline", description="ATM withdrawal forecasting pipeline.")
+    sub = p.add_subparsers(dest="command", metavar="command", required=True)
+
+    # Same options as `python dataCleaning.py`
+    s = sub.add_parser("clean", help="Clean raw transactions and build features.")
+    add_clean_arguments(s)
+    s.set_defaults(func=cmd_clean)
+
+    s = sub.add_parser("train", help="Run the cleaner, then train all models on the raw training CSV.")
+    s.add_argument("--skip-clean", action="store_true",
+                   help="Do not re-run the cleaner (its output files are not used for training).")
+    s.set_defaults(func=cmd_train)
+
+    s = sub.add_parser("predict", help="Generate predictions for every model and write predictions.csv.")
+    s.set_defaults(func=cmd_predict)
+
+    s = sub.add_parser("eval", help="Report RMSE of predictions against actuals.")
+    s.add_argument("--actuals", default="cleaned.csv", help="CSV with actual withdrawals. Default: cleaned.csv")
+    s.add_argument("--predictions", default="predictions.csv", help="CSV with predictions. Default: predictions.csv")
+    s.set_defaults(func=cmd_eval)
+
+    s = sub.add_parser("finalize", help="Write predictions.csv from the Exponential Smoothing predictions.")
+    s.set_defaults(func=cmd_finalize)
+
+    return p
+
+
+def main(argv=None):
+    p = build_parser()
+    args = p.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
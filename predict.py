@@ -2,22 +2,31 @@
 import predictNaive
 import predictMovingAvrg
 import predictExpSmooth
+import Make_Final_Prediction
 import pandas as pd
 
 
-if __name__ == "__main__":
+def main(models=None):
+    # `models` is the dict returned by train.main(); missing entries are read from disk
+    models = models or {}
+
+    # Read the test data once and share it across all models
+    test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
+
     print("=== PREDICTING: Naive Model ===")
-    predictNaive.main()            # writes predictions_naive.csv
+    predictNaive.main(test, models.get("naive"))              # writes predictions_naive.csv
 
     print("=== PREDICTING: Moving Average Model ===")
-    predictMovingAvrg.main()       # writes predictionsMovingAvrg.csv
+    predictMovingAvrg.main(test, models.get("moving_avrg"))   # writes predictionsMovingAvrg.csv
 
     print("=== PREDICTING: Exponential Smoothing Model ===")
-    predictExpSmooth.main()        # writes predictionsExpSmooth.csv
+    best = predictExpSmooth.main(test, models.get("exp_smooth"))  # writes predictionsExpSmooth.csv
 
     print("✅ All model predictions generated successfully.")
 
     # Use your best model’s predictions (e.g. Exponential Smoothing)
-    df = pd.read_csv("predictionsExpSmooth.csv")[["dt", "atm_id", "predicted_withdrawn_kwd", "predicted_withdraw_count"]]
-    df.to_csv("predictions.csv", index=False)
-    print("✅ Final submission file created: predictions.csv")
\ No newline at end of file
+    return Make_Final_Prediction.main(best)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 import pandas as pd
 import numpy as np
 
-def main():
+def main(test=None, params=None):
     PARAMS_FILE = "modelExpSmooth_params.csv"
 
-    # Load model and test data
-    params = pd.read_csv(PARAMS_FILE, parse_dates=["last_train_dt"])
-    test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
+    # Load model and test data (unless passed in from another stage)
+    if params is None:
+        params = pd.read_csv(PARAMS_FILE, parse_dates=["last_train_dt"])
+    if test is None:
+        test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
 
     # Validate structure
     required_test = ["dt", "atm_id"]
@@ -38,6 +40,7 @@ def main():
 
     print(f"✅ Wrote predictionsExpSmooth.csv, shape={out.shape}")
     print(out.head())
+    return out
 
 if __name__ == "__main__":
     main()
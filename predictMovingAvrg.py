@@ -1,12 +1,14 @@
 import pandas as pd
 import numpy as np
 
-def main():
+def main(test=None, model=None):
     PARAMS_FILE = "modelMovingAvrg_params.csv"
 
-    # Load model and test data
-    model = pd.read_csv(PARAMS_FILE)
-    test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
+    # Load model and test data (unless passed in from another stage)
+    if model is None:
+        model = pd.read_csv(PARAMS_FILE)
+    if test is None:
+        test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
 
     # Keep only needed columns
     test = test[["dt", "atm_id"]].dropna(subset=["atm_id", "dt"]).drop_duplicates(["atm_id", "dt"])
@@ -30,6 +32,7 @@ def main():
 
     print(f"✅ Predictions generated: {out.shape[0]} rows, saved to predictionsMovingAvrg.csv")
     print(out.head())
+    return out
 
 if __name__ == "__main__":
     main()
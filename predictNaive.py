@@ -1,9 +1,11 @@
 import pandas as pd
 
-def main():
-    # Load test and trained model
-    test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
-    model = pd.read_csv("model_naive_params.csv")
+def main(test=None, model=None):
+    # Load test and trained model (unless passed in from another stage)
+    if test is None:
+        test = pd.read_csv("atm_transactions_test.csv", parse_dates=["dt"])
+    if model is None:
+        model = pd.read_csv("model_naive_params.csv")
 
     # Validate structure
     required = ["dt", "atm_id"]
@@ -31,6 +33,7 @@ def main():
 
     print(f"✅ wrote predictions_naive.csv, shape={out.shape}")
     print(out.head())
+    return out
 
 if __name__ == "__main__":
     main()
@@ -1,30 +1,40 @@
 # train.py
-import dataCleaning  # <-- add this line
+import dataCleaning
 import trainNaive
 import trainMovingAvrg
 import trainExpSmooth
+import pandas as pd
+
+
+def main(clean=True):
+    if clean:
+        print("=== CLEANING DATA ===")
+        # run the cleaner from dataCleaning.py
+        # adjust the arguments if your cleaner expects different ones
+        dataCleaning.build_outputs(
+            input_csv="atm_transactions_train.csv",   # input raw training data
+            out_clean="atm_transactions_train_clean.csv",  # cleaned dataset
+            out_features="features.csv",              # optional features file
+            weekend_arg="4,5",                        # Friday/Saturday weekend
+            fill_feature_nas=True
+        )
+        print("✅ Data cleaned successfully. Output: atm_transactions_train_clean.csv")
+
+    # Read the training data once and share it across all models
+    df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
 
-if __name__ == "__main__":
-    print("=== CLEANING DATA ===")
-    # run the cleaner from dataCleaning.py
-    # adjust the arguments if your cleaner expects different ones
-    dataCleaning.build_outputs(
-        input_csv="atm_transactions_train.csv",   # input raw training data
-        out_clean="atm_transactions_train_clean.csv",  # cleaned dataset
-        out_features="features.csv",              # optional features file
-        weekend_arg="4,5",                        # Friday/Saturday weekend
-        fill_feature_nas=True
-    )
-    print("✅ Data cleaned successfully. Output: atm_transactions_train_clean.csv")
-
-    # Now run your model trainings using the cleaned file
     print("\n=== TRAINING: Naive Model ===")
-    trainNaive.main()           # produces model_naive_params.csv
+    naive = trainNaive.main(df)              # produces model_naive_params.csv
 
     print("\n=== TRAINING: Moving Average Model ===")
-    trainMovingAvrg.main()      # produces modelMovingAvrg_params.csv
+    moving_avrg = trainMovingAvrg.main(df)   # produces modelMovingAvrg_params.csv
 
     print("\n=== TRAINING: Exponential Smoothing Model ===")
-    trainExpSmooth.main()       # produces modelExpSmooth_params.csv
+    exp_smooth = trainExpSmooth.main(df)     # produces modelExpSmooth_params.csv
 
     print("\n✅ All models trained successfully.")
+    return {"naive": naive, "moving_avrg": moving_avrg, "exp_smooth": exp_smooth}
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 import pandas as pd
 import numpy as np
 
-def main():
+def main(df=None):
     ALPHAS = np.linspace(0.05, 0.95, 19)
     REQUIRED = ["dt", "atm_id", "total_withdrawn_amount_kwd", "total_withdraw_txn_count"]
 
     # Load & clean data
-    df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
+    if df is None:
+        df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
     missing = [c for c in REQUIRED if c not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns in training data: {missing}")
@@ -68,6 +69,7 @@ def main():
 
     print(f"✅ Trained SES model for {len(model)} ATMs → modelExpSmooth_params.csv")
     print(model.head())
+    return model
 
 if __name__ == "__main__":
     main()
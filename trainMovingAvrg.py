@@ -1,11 +1,12 @@
 import pandas as pd
 import numpy as np
 
-def main():
+def main(df=None):
     WINDOW = 14  # number of days for moving average
 
     # Load and keep only needed columns
-    df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
+    if df is None:
+        df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
     df = df[["dt", "atm_id", "total_withdrawn_amount_kwd", "total_withdraw_txn_count"]].copy()
 
     # Clean data
@@ -33,6 +34,7 @@ def main():
 
     print(f"✅ Trained Moving Average model ({WINDOW}-day window) for {len(model)} ATMs")
     print(model.head())
+    return model
 
 if __name__ == "__main__":
     main()
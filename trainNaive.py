@@ -1,8 +1,9 @@
 import pandas as pd
 
-def main():
-    # Load the training data
-    df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
+def main(df=None):
+    # Load the training data (unless the caller already has it in memory)
+    if df is None:
+        df = pd.read_csv("atm_transactions_train.csv", parse_dates=["dt"])
 
     # Expected columns
     required = ["dt", "atm_id", "total_withdrawn_amount_kwd", "total_withdraw_txn_count"]
@@ -32,6 +33,7 @@ def main():
 
     print(f"✅ Naive model trained successfully — saved {len(model)} ATMs to model_naive_params.csv")
     print(model.head())
+    return model
 
 if __name__ == "__main__":
     main()